@@ -0,0 +1,59 @@
+"""AI tasks."""
+
+# pylint: disable=unused-argument, broad-exception-caught
+
+from celery.utils.log import get_task_logger
+
+from core import models
+from core.ai.thread_summarizer import summarize_thread
+from core.ai.utils import get_messages_from_thread
+
+from messages.celery_app import app as celery_app
+
+logger = get_task_logger(__name__)
+
+TOKEN_THRESHOLD_FOR_SUMMARY = 200  # Minimum token count to trigger summarization
+MINIMUM_MESSAGES_FOR_SUMMARY = 3  # Minimum number of messages to trigger summarization
+
+
+@celery_app.task(bind=True)
+def summarize_thread_task(self, thread_id):
+    """Refresh the summary of a thread if it has enough content.
+
+    Args:
+        thread_id: The ID of the thread to summarize
+
+    Returns:
+        dict: A dictionary with success status and info
+    """
+    try:
+        thread = models.Thread.objects.get(id=thread_id)
+    except models.Thread.DoesNotExist:
+        logger.error("Thread %s does not exist", thread_id)
+        return {
+            "thread_id": str(thread_id),
+            "success": False,
+            "error": f"Thread {thread_id} does not exist",
+        }
+
+    messages = get_messages_from_thread(thread)
+    token_count = sum(message.get_tokens_count() for message in messages)
+
+    # Only summarize if the thread has enough content (more than 200 tokens or at least 3 messages)
+    if (
+        token_count < TOKEN_THRESHOLD_FOR_SUMMARY
+        and len(messages) < MINIMUM_MESSAGES_FOR_SUMMARY
+    ):
+        return {"thread_id": str(thread_id), "success": True, "summarized": False}
+
+    try:
+        new_summary = summarize_thread(thread, messages)
+    except Exception as e:
+        logger.exception("Error summarizing thread %s: %s", thread_id, e)
+        return {"thread_id": str(thread_id), "success": False, "error": str(e)}
+
+    if new_summary:
+        thread.summary = new_summary
+        thread.save(update_fields=["summary"])
+
+    return {"thread_id": str(thread_id), "success": True, "summarized": True}
@@ -1,31 +1,46 @@
 import json
+from functools import lru_cache
 from pathlib import Path
+from typing import List, Optional
 
 from django.conf import settings
 from django.utils import translation
 
 from core.ai.utils import get_messages_from_thread
-from core.models import Thread
+from core.models import Message, Thread
 from core.services.ai_service import AIService
 
 
-def summarize_thread(thread: Thread) -> str:
-    """Summarizes a thread using the OpenAI client based on the active Django language."""
+@lru_cache(maxsize=None)
+def get_prompts() -> dict:
+    """Load prompt templates from ai_prompts.json, once per process."""
+    prompts_path = Path(__file__).parent / "ai_prompts.json"
+    with open(prompts_path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def summarize_thread(thread: Thread, messages: Optional[List[Message]] = None) -> str:
+    """Summarizes a thread using the OpenAI client based on the active Django language.
+
+    Callers that already fetched the thread messages with get_messages_from_thread()
+    can pass them to avoid querying and parsing them a second time.
+    """
 
     # Determine the active or fallback language
     active_language = translation.get_language() or settings.LANGUAGE_CODE
 
     # Extract messages from the thread
-    messages = get_messages_from_thread(thread)
-    messages_as_text = "\n\n".join([message.get_as_text() for message in messages])
+    if messages is None:
+        messages = get_messages_from_thread(thread)
 
-    # Load prompt templates from ai_prompts.json
-    prompts_path = Path(__file__).parent / "ai_prompts.json"
-    with open(prompts_path, encoding="utf-8") as f:
-        prompts = json.load(f)
+    # Nothing to summarize: don't pay for an AI call
+    if not messages:
+        return ""
+
+    messages_as_text = "\n\n".join([message.get_as_text() for message in messages])
 
     # Get the prompt for the active language
-    prompt_template = prompts.get(active_language)
+    prompt_template = get_prompts().get(active_language)
     prompt_query = prompt_template["summary_query"]
     prompt = prompt_query.format(messages=messages_as_text, language=active_language)
 
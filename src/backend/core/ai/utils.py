@@ -9,11 +9,7 @@ def get_messages_from_thread(thread: Thread) -> List[Message]:
     """
     Extract messages from a thread and return them as a list of text representations using Message.get_as_text().
     """
-    messages = []
-    for message in thread.messages.all():
-        if not (message.is_draft or message.is_trashed):
-            messages.append(message)
-    return messages
+    return list(thread.messages.filter(is_draft=False, is_trashed=False))
 
 
 ## Check if AI features are enabled based on settings
@@ -190,41 +190,42 @@ class IsAllowedToCreateMessage(IsAuthenticated):
         if not sender_id:
             return False
 
-        # get mailbox instance from sender id
+        # get mailbox instance from sender id, only if the user has required role on it
         try:
             # Store mailbox on the view for later use (e.g., in the view logic)
-            view.mailbox = models.Mailbox.objects.get(id=sender_id)
+            view.mailbox = models.Mailbox.objects.select_related("domain").get(
+                id=sender_id,
+                accesses__user=request.user,
+                accesses__role__in=[
+                    enums.MailboxRoleChoices.EDITOR,
+                    enums.MailboxRoleChoices.ADMIN,
+                    enums.MailboxRoleChoices.SENDER,
+                ],
+            )
         except models.Mailbox.DoesNotExist:
-            return False  # Invalid senderId
-
-        # Check if user has required role on the sender Mailbox
-        has_edit_role = view.mailbox.accesses.filter(
-            user=request.user,
-            role__in=[
-                enums.MailboxRoleChoices.EDITOR,
-                enums.MailboxRoleChoices.ADMIN,
-                enums.MailboxRoleChoices.SENDER,
-            ],
-        ).exists()
-
-        # if user does not have edit role with this sender mailbox, return False
-        if not has_edit_role:
+            # Invalid senderId or user does not have edit role with this sender mailbox
             return False
 
         # --- Additional check for replies ---
         # If creating a reply (parentId is provided), check access to the parent thread
         if parent_id:
             try:
-                parent_message = models.Message.objects.select_related("thread").get(
-                    id=parent_id
+                parent_message = (
+                    models.Message.objects.select_related("thread")
+                    # The reply only needs the thread's stats, not its AI summary
+                    .defer("thread__summary")
+                    .get(id=parent_id)
                 )
                 # Check if the user has access to the thread they are replying to
-                if models.ThreadAccess.objects.filter(
+                if not models.ThreadAccess.objects.filter(
                     thread=parent_message.thread,
                     mailbox=view.mailbox,
                     role=models.ThreadAccessRoleChoices.EDITOR,
                 ).exists():
-                    return True
+                    return False
+                # Store parent message on the view so it is not fetched again
+                view.parent_message = parent_message
+                return True
             except models.Message.DoesNotExist:
                 return False  # Treat invalid parentId as permission failure
 
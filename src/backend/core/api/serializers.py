@@ -238,6 +238,10 @@ class MailboxSerializer(AbilitiesModelSerializer):
 
     def get_count_unread_messages(self, instance):
         """Return the number of unread messages in the mailbox."""
+        # Use the annotated count_unread_messages field
+        if hasattr(instance, "count_unread_messages"):
+            return instance.count_unread_messages
+
         return instance.thread_accesses.aggregate(
             total=Count(
                 "thread__messages", filter=Q(thread__messages__read_at__isnull=True)
@@ -246,6 +250,10 @@ class MailboxSerializer(AbilitiesModelSerializer):
 
     def get_count_messages(self, instance):
         """Return the number of messages in the mailbox."""
+        # Use the annotated count_messages field
+        if hasattr(instance, "count_messages"):
+            return instance.count_messages
+
         return instance.thread_accesses.aggregate(total=Count("thread__messages"))[
             "total"
         ]
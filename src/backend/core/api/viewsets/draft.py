@@ -3,6 +3,7 @@
 import json
 import logging
 import uuid
+from typing import Dict, List, Tuple
 
 from django.db import transaction
 from django.utils import timezone
@@ -181,30 +182,37 @@ class DraftMessageView(APIView):
 
     permission_classes = [permissions.IsAllowedToCreateMessage]
     mailbox = None
+    parent_message = None
+
+    def _get_recipient_contacts(self, request_data: dict) -> Dict[str, models.Contact]:
+        """Resolve the contacts of all recipient types at once.
+
+        This is done before opening the transaction writing the draft, so that
+        the contact lookups don't lengthen it."""
+        return self.mailbox.get_or_create_contacts(
+            {
+                email: None
+                for recipient_type in ["to", "cc", "bcc"]
+                for email in request_data.get(recipient_type) or []
+            }
+        )
 
     def _update_draft_details(
-        self, message: models.Message, request_data: dict
-    ) -> models.Message:
+        self,
+        message: models.Message,
+        request_data: dict,
+        contacts: Dict[str, models.Contact],
+    ) -> Tuple[models.Message, List[str]]:
         """Helper method to update draft details (subject, recipients, body, attachments).
-        Ensures user has access to the thread."""
+        Callers must have checked that the sender mailbox has editor access to the
+        thread and resolved the recipient contacts with `_get_recipient_contacts`.
+
+        Returns the message and the thread fields to save, which is left to the caller
+        so it can be done along with the thread stats update."""
 
         updated_fields = []
         thread_updated_fields = ["updated_at"]  # Always update thread timestamp
 
-        # --- Check Access (redundant if permission class covers it, but safe) ---
-        # Ensure user has access to the thread this message belongs to
-        if (
-            message.thread
-            and not models.ThreadAccess.objects.filter(
-                thread=message.thread,
-                mailbox=self.mailbox,
-                role=models.ThreadAccessRoleChoices.EDITOR,
-            ).exists()
-        ):
-            raise drf.exceptions.PermissionDenied(
-                "Access denied to this message's thread."
-            )
-
         # Update subject if provided
         if "subject" in request_data:
             message.subject = request_data["subject"]
@@ -221,35 +229,37 @@ class DraftMessageView(APIView):
             "cc": enums.MessageRecipientTypeChoices.CC,
             "bcc": enums.MessageRecipientTypeChoices.BCC,
         }
-        recipient_types = ["to", "cc", "bcc"]
+        recipient_types = [
+            recipient_type
+            for recipient_type in ["to", "cc", "bcc"]
+            if recipient_type in request_data
+        ]
+        new_recipients = []
         for recipient_type in recipient_types:
-            if recipient_type in request_data:
-                # Delete existing recipients of this type
-                # Ensure message has a pk before accessing m2m
-                if message.pk:
-                    message.recipients.filter(
-                        type=recipient_type_mapping[recipient_type]
-                    ).delete()
-
-                # Create new recipients
-                emails = request_data.get(recipient_type) or []
-                for email in emails:
-                    contact, _ = models.Contact.objects.get_or_create(
-                        email__iexact=email,
-                        mailbox=self.mailbox,
-                        defaults={  # Provide defaults for creation
-                            "email": email,
-                            "name": email.split("@")[0],  # Basic default name
-                        },
+            # Delete existing recipients of this type
+            # Ensure message has a pk before accessing m2m
+            if message.pk:
+                message.recipients.filter(
+                    type=recipient_type_mapping[recipient_type]
+                ).delete()
+
+            # Create new recipients
+            for email in request_data.get(recipient_type) or []:
+                contact = contacts[email.lower()]
+                new_recipients.append(
+                    models.MessageRecipient(
+                        message=message,
+                        contact=contact,
+                        type=recipient_type_mapping[recipient_type],
                     )
-                    # Only create MessageRecipient if message has been saved
-                    if message.pk:
-                        models.MessageRecipient.objects.get_or_create(
-                            message=message,
-                            contact=contact,
-                            type=recipient_type_mapping[recipient_type],
-                        )
-                    # If message not saved yet (POST case), recipients will be added after save
+                )
+
+        # Only create MessageRecipients if message has been saved.
+        # Duplicate addresses in a list are skipped by the unique constraint.
+        if new_recipients and message.pk:
+            models.MessageRecipient.objects.bulk_create(
+                new_recipients, ignore_conflicts=True
+            )
 
         # Update draft body if provided
         if "draftBody" in request_data:
@@ -298,8 +308,9 @@ class DraftMessageView(APIView):
                         if isinstance(blob_id, str):
                             blob_id = uuid.UUID(blob_id)
 
-                        # Try to get the blob
-                        blob = models.Blob.objects.get(id=blob_id)
+                        # Try to get the blob. Only its id is needed to link the
+                        # attachment, so don't load the (possibly large) content.
+                        blob = models.Blob.objects.only("id").get(id=blob_id)
 
                         # Create an attachment for this blob if it doesn't exist
                         attachment, created = models.Attachment.objects.get_or_create(
@@ -307,7 +318,7 @@ class DraftMessageView(APIView):
                         )
 
                         if created:
-                            logger.info(
+                            logger.debug(
                                 "Created new attachment %s for blob %s",
                                 attachment.id,
                                 blob_id,
@@ -348,59 +359,18 @@ class DraftMessageView(APIView):
             message.has_attachments = has_attachments
             updated_fields.append("has_attachments")
 
-        # Save message and thread if changes were made
+        # Save message if changes were made
         if updated_fields and message.pk:  # Only save if message exists
             message.save(update_fields=updated_fields + ["updated_at"])
-        if thread_updated_fields and message.thread.pk:  # Check thread exists
-            message.thread.save(
-                update_fields=list(set(thread_updated_fields))
-            )  # Use set to avoid duplicate updated_at
 
-        return message
+        # Use set to avoid duplicate updated_at
+        return message, list(set(thread_updated_fields))
 
-    @transaction.atomic
     def post(self, request):
         """Create a new draft message."""
-        sender_id = request.data.get("senderId")
-        self.mailbox = models.Mailbox.objects.get(id=sender_id)
         subject = request.data.get("subject")
 
-        sender_mailbox = self.mailbox
-
-        # Then get the parent message if it's a reply
-        parent_id = request.data.get("parentId")
-        reply_to_message = None
-        if parent_id:
-            try:
-                # Reply to an existing message in a thread
-                reply_to_message = models.Message.objects.select_related("thread").get(
-                    id=parent_id
-                )
-                # Ensure user has access to parent thread (already checked by permission, but safe)
-                if not models.ThreadAccess.objects.filter(
-                    thread=reply_to_message.thread,
-                    mailbox=sender_mailbox,
-                    role=models.ThreadAccessRoleChoices.EDITOR,
-                ).exists():
-                    raise drf.exceptions.PermissionDenied(
-                        "Access denied to the thread you are replying to."
-                    )
-                thread = reply_to_message.thread
-
-            except models.Message.DoesNotExist as exc:
-                raise drf.exceptions.NotFound("Parent message not found.") from exc
-        else:
-            # Create a new thread for the new draft
-            thread = models.Thread.objects.create(
-                subject=subject,
-            )
-            # Grant access to the creator via the sending mailbox context
-            # permission to create a draft message if already check with permission class
-            models.ThreadAccess.objects.create(
-                thread=thread,
-                mailbox=sender_mailbox,
-                role=enums.ThreadAccessRoleChoices.EDITOR,
-            )
+        sender_mailbox = self.mailbox  # Set by permission class
 
         # --- Get Sender Contact --- #
         # Find the contact associated with the sending mailbox
@@ -414,27 +384,53 @@ class DraftMessageView(APIView):
                 "name": self.mailbox.local_part,  # Basic default name
             },
         )
+        contacts = self._get_recipient_contacts(request.data)
+
+        with transaction.atomic():
+            # Then get the parent message if it's a reply
+            parent_id = request.data.get("parentId")
+            reply_to_message = None
+            if parent_id:
+                # Reply to an existing message in a thread. The permission class
+                # already fetched it and checked access to its thread.
+                reply_to_message = self.parent_message
+                thread = reply_to_message.thread
+            else:
+                # Create a new thread for the new draft
+                thread = models.Thread.objects.create(
+                    subject=subject,
+                )
+                # Grant access to the creator via the sending mailbox context
+                # permission to create a draft message if already check with
+                # permission class
+                models.ThreadAccess.objects.create(
+                    thread=thread,
+                    mailbox=sender_mailbox,
+                    role=enums.ThreadAccessRoleChoices.EDITOR,
+                )
 
-        # Create message instance with all data
-        message = models.Message(
-            thread=thread,
-            sender=sender_contact,
-            parent=reply_to_message,
-            subject=subject,
-            read_at=timezone.now(),
-            is_draft=True,
-            is_sender=True,
-            draft_blob=self.mailbox.create_blob(
-                content=(request.data.get("draftBody") or "").encode("utf-8"),
-                content_type="application/json",
-            ),
-        )
-        message.save()  # Save message before adding recipients
+            # Create message instance with all data
+            message = models.Message(
+                thread=thread,
+                sender=sender_contact,
+                parent=reply_to_message,
+                subject=subject,
+                read_at=timezone.now(),
+                is_draft=True,
+                is_sender=True,
+                draft_blob=self.mailbox.create_blob(
+                    content=(request.data.get("draftBody") or "").encode("utf-8"),
+                    content_type="application/json",
+                ),
+            )
+            message.save()  # Save message before adding recipients
 
-        # Populate details using helper
-        message = self._update_draft_details(message, request.data)
+            # Populate details using helper
+            message, thread_updated_fields = self._update_draft_details(
+                message, request.data, contacts
+            )
 
-        thread.update_stats()
+            thread.update_stats(update_fields=thread_updated_fields)
 
         # Refresh required as _update_draft_details might have saved again
         message.refresh_from_db()
@@ -442,52 +438,49 @@ class DraftMessageView(APIView):
             serializers.MessageSerializer(message).data, status=status.HTTP_201_CREATED
         )
 
-    @transaction.atomic
     def put(self, request, message_id: str):
         """Update an existing draft message."""
         if not message_id:
             raise drf.exceptions.ValidationError(
                 "Message ID is required for updating a draft."
             )
-        # Get sender mailbox (needed for contact creation in helper)
+        # Sender mailbox (needed for contact creation in helper)
         # TODO: Should senderId be required in PUT? Or derive from message?
         # Assuming it's required for now, matching POST.
-        sender_id = request.data.get("senderId")
-        if not sender_id:
-            raise drf.exceptions.ValidationError(
-                "senderId is required in request body for update."
-            )
-        try:
-            # Make sure senderId corresponds to an actual mailbox
-            self.mailbox = models.Mailbox.objects.get(id=sender_id)
-        except models.Mailbox.DoesNotExist as exc:
-            raise drf.exceptions.NotFound(
-                f"Mailbox with senderId {sender_id} not found."
-            ) from exc
-
         # Permission class checks senderId validity, send permission, and thread access.
         sender_mailbox = self.mailbox  # Set by permission class
 
         try:
             # Fetch the draft message, ensuring it belongs to the user indirectly via ThreadAccess
             # and matches the sender mailbox context if that's a requirement for *updating*.
-            message = models.Message.objects.select_related("thread", "draft_blob").get(
-                id=message_id,
-                is_draft=True,
-                # Ensure the user has access to this thread
-                thread__accesses__mailbox=sender_mailbox,
-                thread__accesses__role=models.ThreadAccessRoleChoices.EDITOR,
+            message = (
+                models.Message.objects.select_related("thread", "draft_blob")
+                # The previous draft body is only ever deleted, never read, and
+                # the thread's AI summary is not needed to update its stats
+                .defer("draft_blob__raw_content", "thread__summary")
+                .get(
+                    id=message_id,
+                    is_draft=True,
+                    # Ensure the user has access to this thread
+                    thread__accesses__mailbox=sender_mailbox,
+                    thread__accesses__role=models.ThreadAccessRoleChoices.EDITOR,
+                )
             )
         except models.Message.DoesNotExist as exc:
             raise drf.exceptions.NotFound(
                 "Draft message not found, is not a draft, or access denied."
             ) from exc
 
-        # Populate details using helper, passing user for potential checks
-        updated_message = self._update_draft_details(message, request.data)
+        contacts = self._get_recipient_contacts(request.data)
+
+        with transaction.atomic():
+            # Populate details using helper, passing user for potential checks
+            updated_message, thread_updated_fields = self._update_draft_details(
+                message, request.data, contacts
+            )
 
-        # Update thread stats
-        updated_message.thread.update_stats()
+            # Update thread stats, saving the fields changed by the helper at once
+            updated_message.thread.update_stats(update_fields=thread_updated_fields)
 
         # Refresh needed as helper might save thread
         updated_message.refresh_from_db()
@@ -1,6 +1,7 @@
 """API ViewSet for Mailbox model."""
 
-from django.db.models import OuterRef, Q, Subquery
+from django.db.models import Count, OuterRef, Q, Subquery
+from django.db.models.functions import Coalesce
 
 from drf_spectacular.utils import OpenApiParameter, OpenApiTypes, extend_schema
 from rest_framework import mixins, viewsets
@@ -21,17 +22,45 @@ class MailboxViewSet(
     permission_classes = [permissions.IsAuthenticated]
     pagination_class = None
 
+    @staticmethod
+    def _annotate_message_counts(queryset):
+        """Annotate message counts so the serializer doesn't query them per mailbox."""
+
+        def count_subquery(**filters):
+            return Coalesce(
+                Subquery(
+                    models.ThreadAccess.objects.filter(mailbox=OuterRef("pk"))
+                    .values("mailbox")
+                    .annotate(total=Count("thread__messages", filter=Q(**filters)))
+                    .values("total")[:1]
+                ),
+                0,
+            )
+
+        return queryset.annotate(
+            count_messages=count_subquery(),
+            count_unread_messages=count_subquery(
+                thread__messages__read_at__isnull=True
+            ),
+        )
+
     def get_queryset(self):
         """Restrict results to the current user's mailboxes."""
         user = self.request.user
         # for superuser, return all mailboxes
         if user.is_superuser and user.is_staff:
-            return models.Mailbox.objects.all()
+            return self._annotate_message_counts(
+                models.Mailbox.objects.select_related("domain")
+            )
 
         # For regular users, annotate with their actual role
         return (
-            models.Mailbox.objects.filter(accesses__user=user)
-            .prefetch_related("accesses__user", "domain")
+            self._annotate_message_counts(
+                models.Mailbox.objects.filter(accesses__user=user)
+            )
+            # The email is built from the domain name, and the annotated role
+            # makes prefetching the accesses unnecessary
+            .select_related("domain")
             .annotate(
                 user_role=Subquery(
                     models.MailboxAccess.objects.filter(
@@ -48,6 +48,9 @@ class MessageViewSet(
                 queryset = queryset.filter(thread__id=thread_id).order_by("created_at")
             else:
                 return queryset.none()
+        elif self.action == "destroy":
+            # The thread is needed to check access, then to delete it or update stats
+            queryset = queryset.select_related("thread")
 
         return queryset
 
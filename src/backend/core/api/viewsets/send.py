@@ -2,6 +2,8 @@
 
 import logging
 
+from django.db import transaction
+
 from drf_spectacular.utils import (
     OpenApiExample,
     extend_schema,
@@ -105,50 +107,52 @@ class SendMessageView(APIView):
             raise drf_exceptions.ValidationError("senderId is required.")
 
         try:
-            mailbox_sender = models.Mailbox.objects.get(id=sender_id)
+            # The domain is needed to sign the outbound message
+            mailbox_sender = models.Mailbox.objects.select_related("domain").get(
+                id=sender_id
+            )
         except models.Mailbox.DoesNotExist as e:
             raise drf_exceptions.NotFound("Sender mailbox not found.") from e
 
-        try:
-            message = (
-                models.Message.objects.select_related("sender")
-                .prefetch_related(
-                    "thread__accesses", "recipients__contact", "attachments__blob"
-                )
-                .get(
-                    id=message_id,
-                    is_draft=True,
-                    thread__accesses__mailbox=mailbox_sender,
+        # Lock the draft while it is being prepared, so that concurrent requests
+        # cannot send it twice
+        with transaction.atomic():
+            try:
+                message = (
+                    # Recipients and attachments are queried by
+                    # prepare_outbound_message itself, prefetching them would
+                    # only load them (and the attachment contents) twice.
+                    models.Message.objects.select_related("sender", "thread")
+                    .defer("thread__summary")
+                    .select_for_update(of=("self",))
+                    .get(
+                        id=message_id,
+                        is_draft=True,
+                        thread__accesses__mailbox=mailbox_sender,
+                    )
                 )
+            except models.Message.DoesNotExist as e:
+                raise drf_exceptions.NotFound(
+                    "Draft message not found or does not belong to the specified sender mailbox."
+                ) from e
+
+            self.check_object_permissions(request, message)
+
+            prepared = prepare_outbound_message(
+                mailbox_sender,
+                message,
+                request.data.get("textBody"),
+                request.data.get("htmlBody"),
             )
-        except models.Message.DoesNotExist as e:
-            raise drf_exceptions.NotFound(
-                "Draft message not found or does not belong to the specified sender mailbox."
-            ) from e
-
-        self.check_object_permissions(request, message)
-
-        prepared = prepare_outbound_message(
-            mailbox_sender,
-            message,
-            request.data.get("textBody"),
-            request.data.get("htmlBody"),
-        )
-        if not prepared:
-            raise drf_exceptions.APIException(
-                "Failed to prepare message for sending.",
-                code=status.HTTP_500_INTERNAL_SERVER_ERROR,
-            )
+            if not prepared:
+                raise drf_exceptions.APIException(
+                    "Failed to prepare message for sending.",
+                    code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+                )
 
         # Launch async task for sending the message
         task = send_message_task.delay(str(message.id))
 
-        # --- Finalize ---
-        # Message state should be updated by prepare_outbound_message/send_message
-        # Refresh from DB to get final state (e.g., is_draft=False)
-        message.refresh_from_db()
-
-        # Update thread stats after un-drafting
-        message.thread.update_stats()
-
+        # Message state and thread stats were already updated by
+        # prepare_outbound_message, the task only handles delivery.
         return Response({"task_id": task.id}, status=status.HTTP_200_OK)
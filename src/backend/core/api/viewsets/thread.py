@@ -38,14 +38,15 @@ class ThreadViewSet(
         mailbox_id = self.request.GET.get("mailbox_id")
         label_slug = self.request.GET.get("label_slug")
 
-        # Base queryset: Threads the user has access to via ThreadAccess
+        # Base queryset: Threads the user has access to via ThreadAccess.
+        # The Exists() subquery doesn't duplicate rows, so no distinct() is needed.
         queryset = models.Thread.objects.filter(
             Exists(
                 models.ThreadAccess.objects.filter(
                     mailbox__accesses__user=user, thread=OuterRef("pk")
                 )
             )
-        ).distinct()
+        )
 
         if mailbox_id:
             # Ensure the user actually has access to the specified mailbox_id itself
@@ -69,8 +70,9 @@ class ThreadViewSet(
                 # Further filter by mailbox if specified
                 labels = labels.filter(mailbox__id=mailbox_id)
 
-            # Filter threads that have any of these labels
-            queryset = queryset.filter(labels__in=labels)
+            # Filter threads that have any of these labels. Several labels can share
+            # the slug across mailboxes, so this join can duplicate threads.
+            queryset = queryset.filter(labels__in=labels).distinct()
 
         # Apply boolean filters
         # These filters operate on the Thread model's boolean fields
@@ -96,7 +96,7 @@ class Command(BaseCommand):
                 user = User.objects.get(id=user_id)
             except User.DoesNotExist:
                 logger.warning(
-                    f"User with ID {user_id} not found for session {session_key}"
+                    "User with ID %s not found for session %s", user_id, session_key
                 )
                 return None
 
@@ -104,7 +104,7 @@ class Command(BaseCommand):
 
         # pylint: disable=broad-except
         except Exception as e:
-            logger.error(f"Failed to process session {redis_key}: {e}")
+            logger.error("Failed to process session %s: %s", redis_key, e)
             return None
 
     def _print_specific_session(self, redis, SessionStore, prefix, session_id, verbose):
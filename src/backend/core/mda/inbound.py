@@ -8,18 +8,29 @@ from typing import Any, Dict, List, Optional, Tuple
 
 from django.conf import settings
 from django.core.exceptions import ValidationError
+from django.db import transaction
 from django.db.utils import Error as DjangoDbError
 from django.utils import timezone
 
 from core import models
-from core.ai.thread_summarizer import summarize_thread
-from core.ai.utils import get_messages_from_thread, is_ai_summary_enabled
+from core.ai.tasks import summarize_thread_task
+from core.ai.utils import is_ai_summary_enabled
 
 logger = logging.getLogger(__name__)
 
 # Helper function to extract Message-IDs
 MESSAGE_ID_RE = re.compile(r"<([^<>]+)>")
 
+# Helpers to turn an HTML body into a plain-text snippet. The tag pattern excludes
+# "<" so it can't backtrack across unclosed tags in malformed HTML.
+HTML_SCRIPT_STYLE_RE = re.compile(
+    r"<(script|style)\b[^>]*>.*?</\1\s*>", re.DOTALL | re.IGNORECASE
+)
+HTML_TAG_RE = re.compile(r"<[^<>]+>")
+
+# Reply and forward prefixes stripped from subjects when matching threads
+SUBJECT_PREFIX_RE = re.compile(r"^((re|fwd|fw|rep|tr|rép)\s*:\s+)+", re.IGNORECASE)
+
 IMAP_LABEL_TO_MESSAGE_FLAG = {
     "Drafts": "is_draft",
     "Brouillons": "is_draft",
@@ -72,10 +83,6 @@ IMAP_LABELS_TO_IGNORE = [
 ]
 
 
-TOKEN_THRESHOLD_FOR_SUMMARY = 200  # Minimum token count to trigger summarization
-MINIMUM_MESSAGES_FOR_SUMMARY = 3  # Minimum number of messages to trigger summarization
-
-
 def compute_labels_and_flags(
     parsed_email: Dict[str, Any],
     imap_labels: Optional[List[str]],
@@ -215,14 +222,6 @@ def find_thread_for_inbound_message(
         # Extract all unique message IDs from a header string
         return set(MESSAGE_ID_RE.findall(txt or ""))
 
-    def canonicalize_subject(subject):
-        return re.sub(
-            r"^((re|fwd|fw|rep|tr|rép)\s*:\s+)+",
-            "",
-            subject.lower(),
-            flags=re.IGNORECASE,
-        ).strip()
-
     # --- Logic --- #
     in_reply_to_ids = (
         {parsed_email.get("in_reply_to")} if parsed_email.get("in_reply_to") else set()
@@ -255,9 +254,9 @@ def find_thread_for_inbound_message(
         return None  # No matching messages found by ID in this mailbox
 
     # Strategy 1: Match by reference AND canonical subject
-    incoming_subject_canonical = canonicalize_subject(parsed_email.get("subject"))
+    incoming_subject_canonical = _canonicalize_subject(parsed_email.get("subject"))
     for parent in potential_parents:
-        parent_subject_canonical = canonicalize_subject(parent.subject)
+        parent_subject_canonical = _canonicalize_subject(parent.subject)
         if incoming_subject_canonical == parent_subject_canonical:
             return parent.thread  # Found a match!
 
@@ -266,6 +265,17 @@ def find_thread_for_inbound_message(
     return None  # potential_parents.first().thread
 
 
+def _canonicalize_subject(subject: str) -> str:
+    """Lowercase a subject and strip its reply and forward prefixes."""
+    return SUBJECT_PREFIX_RE.sub("", subject.lower()).strip()
+
+
+def _html_to_snippet(html_content: str) -> str:
+    """Build a plain-text snippet from an HTML body, skipping script and style content."""
+    clean_text = HTML_TAG_RE.sub(" ", HTML_SCRIPT_STYLE_RE.sub(" ", html_content))
+    return " ".join(html.unescape(clean_text).split())[:140]
+
+
 def _find_thread_by_message_ids(
     in_reply_to: str, references: str, mailbox: models.Mailbox
 ) -> Optional[models.Thread]:
@@ -387,12 +397,7 @@ def deliver_inbound_message(  # pylint: disable=too-many-branches, too-many-stat
             # If no thread found by message IDs, try by subject
             if not thread and subject:
                 # Look for threads with similar subjects
-                canonical_subject = re.sub(
-                    r"^((re|fwd|fw|rep|tr|rép)\s*:\s+)+",
-                    "",
-                    subject.lower(),
-                    flags=re.IGNORECASE,
-                ).strip()
+                canonical_subject = _canonicalize_subject(subject)
                 thread = models.Thread.objects.filter(
                     subject__iregex=rf"^(re|fwd|fw|rep|tr|rép)\s*:\s*{re.escape(canonical_subject)}$",
                     accesses__mailbox=mailbox,
@@ -407,9 +412,7 @@ def deliver_inbound_message(  # pylint: disable=too-many-branches, too-many-stat
             if text_body := parsed_email.get("textBody"):
                 snippet = text_body[0].get("content", "")[:140]
             elif html_body := parsed_email.get("htmlBody"):
-                html_content = html_body[0].get("content", "")
-                clean_text = re.sub("<[^>]+>", " ", html_content)
-                snippet = " ".join(html.unescape(clean_text).strip().split())[:140]
+                snippet = _html_to_snippet(html_body[0].get("content", ""))
             # Fallback to subject if no body content
             elif subject_val := parsed_email.get("subject"):
                 snippet = subject_val[:140]
@@ -653,9 +656,7 @@ def deliver_inbound_message(  # pylint: disable=too-many-branches, too-many-stat
         if text_body := parsed_email.get("textBody"):
             new_snippet = text_body[0].get("content", "")[:140]
         elif html_body := parsed_email.get("htmlBody"):
-            html_content = html_body[0].get("content", "")
-            clean_text = re.sub("<[^>]+>", " ", html_content)
-            new_snippet = " ".join(html.unescape(clean_text).strip().split())[:140]
+            new_snippet = _html_to_snippet(html_body[0].get("content", ""))
         elif subject_val := parsed_email.get("subject"):  # Fallback to subject
             new_snippet = subject_val[:140]
         else:
@@ -665,20 +666,12 @@ def deliver_inbound_message(  # pylint: disable=too-many-branches, too-many-stat
             thread.snippet = new_snippet
             thread.save(update_fields=["snippet"])
 
-        # Update summary if needed is ai is enabled
+        # Update summary in the background if ai is enabled, so that delivery
+        # doesn't wait for the AI API. Wait for the commit, so that the task
+        # sees the new message.
         if is_ai_summary_enabled():
-            messages = get_messages_from_thread(thread)
-            token_count = sum(message.get_tokens_count() for message in messages)
-
-            # Only summarize if the thread has enough content (more than 200 tokens or at least 3 messages)
-            if (
-                token_count >= TOKEN_THRESHOLD_FOR_SUMMARY
-                or len(messages) >= MINIMUM_MESSAGES_FOR_SUMMARY
-            ):
-                new_summary = summarize_thread(thread)
-                if new_summary:
-                    thread.summary = new_summary
-                    thread.save(update_fields=["summary"])
+            thread_id = str(thread.id)
+            transaction.on_commit(lambda: summarize_thread_task.delay(thread_id))
 
     except Exception as e:
         logger.exception(
@@ -114,27 +114,19 @@ def prepare_outbound_message(
         "message_id": message.mime_id,
     }
 
-    # Add attachments if present
-    if message.attachments.exists():
-        attachments = []
-        for attachment in message.attachments.select_related("blob").all():
-            # Get the blob data
-            blob = attachment.blob
-
-            # Add the attachment to the MIME data
-            attachments.append(
-                {
-                    "content": blob.get_content(),  # Decompressed binary content
-                    "type": blob.content_type,  # MIME type
-                    "name": attachment.name,  # Original filename
-                    "disposition": "attachment",  # Default to attachment disposition
-                    "size": blob.size,  # Size in bytes
-                }
-            )
-
-        # Add attachments to the MIME data
-        if attachments:
-            mime_data["attachments"] = attachments
+    # Add attachments if present, fetching them once for composing and cleaning up
+    message_attachments = list(message.attachments.select_related("blob"))
+    if message_attachments:
+        mime_data["attachments"] = [
+            {
+                "content": attachment.blob.get_content(),  # Decompressed binary content
+                "type": attachment.blob.content_type,  # MIME type
+                "name": attachment.name,  # Original filename
+                "disposition": "attachment",  # Default to attachment disposition
+                "size": attachment.blob.size,  # Size in bytes
+            }
+            for attachment in message_attachments
+        ]
 
     # Assemble the raw mime message
     try:
@@ -169,23 +161,23 @@ def prepare_outbound_message(
     message.is_draft = False
     message.draft_blob = None
     message.created_at = timezone.now()
-    message.updated_at = timezone.now()
-    message.save(
-        update_fields=[
-            "updated_at",
-            "blob",
-            "mime_id",
-            "is_draft",
-            "draft_blob",
-            "created_at",
-        ]
+    message.updated_at = message.created_at
+    # Write the changed columns directly rather than through save(), whose
+    # full_clean() would query every foreign key of the message again.
+    models.Message.objects.filter(pk=message.pk).update(
+        updated_at=message.updated_at,
+        blob=blob,
+        mime_id=message.mime_id,
+        is_draft=False,
+        draft_blob=None,
+        created_at=message.created_at,
     )
     message.thread.update_stats()
 
     # Clean up the draft blob and the attachment blobs
     if draft_blob:
         draft_blob.delete()
-    for attachment in message.attachments.all():
+    for attachment in message_attachments:
         if attachment.blob:
             attachment.blob.delete()
         attachment.delete()
@@ -202,7 +194,9 @@ def send_message(message: models.Message, force_mta_out: bool = False):
     message.sent_at = timezone.now()
     message.save(update_fields=["sent_at"])
 
-    mime_data = parse_email_message(message.blob.get_content())
+    # Decompress the raw MIME once, it is reused for every internal delivery
+    raw_mime = message.blob.get_content()
+    mime_data = parse_email_message(raw_mime)
 
     # Include all recipients in the envelope that have not been delivered yet, including BCC
     envelope_to = {
@@ -269,7 +263,7 @@ def send_message(message: models.Message, force_mta_out: bool = False):
         ):
             try:
                 delivered = deliver_inbound_message(
-                    recipient_email, mime_data, message.blob.get_content()
+                    recipient_email, mime_data, raw_mime
                 )
                 _mark_delivered(recipient_email, delivered, True)
             except Exception as e:
@@ -0,0 +1,17 @@
+# Generated by Django 5.1.8 on 2025-07-28 14:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('core', '0004_alter_maildomain_custom_attributes_and_more'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='message',
+            index=models.Index(condition=models.Q(('is_draft', False), ('is_trashed', False)), fields=['thread', '-created_at'], name='message_thread_active_idx'),
+        ),
+    ]
@@ -15,6 +15,7 @@ from django.contrib.auth.base_user import AbstractBaseUser
 from django.core import validators
 from django.core.exceptions import ValidationError
 from django.db import models
+from django.db.models.functions import Lower
 from django.utils.text import slugify
 from django.utils.translation import gettext_lazy as _
 
@@ -527,6 +528,60 @@ class Mailbox(BaseModel):
 
         return blob
 
+    def get_or_create_contacts(
+        self, contacts: Dict[str, Optional[str]]
+    ) -> Dict[str, "Contact"]:
+        """
+        Get or create the contacts of this mailbox for several email addresses at once.
+
+        Emails are matched case-insensitively against existing contacts. Missing
+        contacts are created in bulk, named after the given name or the local part
+        of their email address.
+
+        Args:
+            contacts: Mapping of email address to contact name (or None)
+
+        Returns:
+            Mapping of lowercased email address to Contact instance
+
+        Raises:
+            ValidationError: If the email address of a missing contact is invalid
+        """
+        wanted = {}
+        for email, name in contacts.items():
+            wanted.setdefault(email.lower(), (email, name))
+        if not wanted:
+            return {}
+
+        def fetch(emails_lower):
+            return {
+                contact.email_lower: contact
+                for contact in Contact.objects.annotate(
+                    email_lower=Lower("email")
+                ).filter(mailbox=self, email_lower__in=emails_lower)
+            }
+
+        found = fetch(wanted.keys())
+        missing = wanted.keys() - found.keys()
+        if missing:
+            new_contacts = [
+                Contact(
+                    email=wanted[email_lower][0],
+                    name=wanted[email_lower][1] or wanted[email_lower][0].split("@")[0],
+                    mailbox=self,
+                )
+                for email_lower in missing
+            ]
+            # bulk_create skips save() and its full_clean(), validate the email
+            # and name here. The mailbox is self and needs no lookup.
+            for contact in new_contacts:
+                contact.clean_fields(exclude=["mailbox"])
+            Contact.objects.bulk_create(new_contacts, ignore_conflicts=True)
+            # Re-fetch to get the ids of rows created concurrently
+            found.update(fetch(missing))
+
+        return found
+
     def get_abilities(self, user):
         """
         Compute and return abilities for a given user on the mailbox.
@@ -637,12 +692,15 @@ class Thread(BaseModel):
     def __str__(self):
         return str(self.subject) if self.subject else "(no subject)"
 
-    def update_stats(self):
-        """Update the denormalized stats of the thread."""
+    def update_stats(self, update_fields: Optional[List[str]] = None):
+        """Update the denormalized stats of the thread.
+
+        Any extra `update_fields` are saved along with the stats, so that callers
+        which also modified other fields of the thread only issue a single UPDATE.
+        """
         # Fetch all message metadata in a single query to avoid multiple DB hits
         message_data = list(
-            self.messages.select_related("sender")
-            .values(
+            self.messages.values(
                 "is_unread",
                 "is_trashed",
                 "is_draft",
@@ -653,8 +711,7 @@ class Thread(BaseModel):
                 "has_attachments",
                 "created_at",
                 "sender__name",
-            )
-            .order_by("created_at")
+            ).order_by("created_at")
         )
 
         if not message_data:
@@ -671,80 +728,66 @@ class Thread(BaseModel):
             self.messaged_at = None
             self.sender_names = None
         else:
-            # Compute stats in Python
-            self.has_unread = any(
-                msg["is_unread"] and not msg["is_trashed"] for msg in message_data
-            )
-            self.has_trashed = any(msg["is_trashed"] for msg in message_data)
-            self.has_draft = any(
-                msg["is_draft"] and not msg["is_trashed"] for msg in message_data
-            )
-            self.has_starred = any(
-                msg["is_starred"] and not msg["is_trashed"] for msg in message_data
-            )
-            self.has_sender = any(
-                msg["is_sender"] and not msg["is_trashed"] and not msg["is_draft"]
-                for msg in message_data
-            )
-            self.has_attachments = any(
-                msg["has_attachments"] and not msg["is_trashed"] for msg in message_data
-            )
+            # Compute stats in Python, in a single pass over the messages
+            self.has_unread = False
+            self.has_trashed = False
+            self.has_draft = False
+            self.has_starred = False
+            self.has_sender = False
+            self.has_attachments = False
+            self.has_active = False
+            # First and last non-trashed, non-spam messages
+            first_active = last_active = None
+            last_non_trashed_at = None
+
+            for msg in message_data:
+                if msg["is_trashed"]:
+                    self.has_trashed = True
+                    continue
+
+                self.has_unread |= msg["is_unread"]
+                self.has_draft |= msg["is_draft"]
+                self.has_starred |= msg["is_starred"]
+                self.has_sender |= msg["is_sender"] and not msg["is_draft"]
+                self.has_attachments |= msg["has_attachments"]
+                # Active messages: !is_sender && !is_spam && !is_archived && !is_trashed && !is_draft
+                self.has_active |= not (
+                    msg["is_sender"]
+                    or msg["is_spam"]
+                    or msg["is_archived"]
+                    or msg["is_draft"]
+                )
+                # Messages are ordered by creation date, the last one is the most recent
+                last_non_trashed_at = msg["created_at"]
+
+                if not msg["is_spam"]:
+                    if first_active is None:
+                        first_active = msg
+                    last_active = msg
 
             # Check if we have any non-trashed, non-spam messages
-            active_messages = [
-                msg
-                for msg in message_data
-                if not msg["is_trashed"] and not msg["is_spam"]
-            ]
-            self.has_messages = len(active_messages) > 0
+            self.has_messages = last_active is not None
 
             # Set is_spam based on first message
             self.is_spam = message_data[0]["is_spam"]
 
-            # Check if thread has active messages (!is_sender && !is_spam && !is_archived && !is_trashed && !is_draft)
-            self.has_active = any(
-                not msg["is_sender"]
-                and not msg["is_spam"]
-                and not msg["is_archived"]
-                and not msg["is_trashed"]
-                and not msg["is_draft"]
-                for msg in message_data
+            # Set messaged_at to the creation time of the most recent non-trashed
+            # message, or of the most recent message if they are all trashed
+            self.messaged_at = (
+                last_non_trashed_at
+                if last_non_trashed_at is not None
+                else message_data[-1]["created_at"]
             )
 
-            # Set messaged_at to the creation time of the most recent non-trashed message
-            non_trashed_messages = [
-                msg for msg in message_data if not msg["is_trashed"]
-            ]
-            if non_trashed_messages:
-                self.messaged_at = max(
-                    msg["created_at"] for msg in non_trashed_messages
-                )
-            elif len(message_data) > 0:
-                self.messaged_at = max(msg["created_at"] for msg in message_data)
+            # Set sender names (first and last sender names), preferring active messages
+            if last_active is None:
+                first_active, last_active = message_data[0], message_data[-1]
+            first_sender = first_active["sender__name"]
+            last_sender = last_active["sender__name"]
+            if last_sender is not None and first_sender != last_sender:
+                self.sender_names = [first_sender, last_sender]
             else:
-                self.messaged_at = None
-
-            # Set sender names (first and last sender names)
-            sender_names = None
-            if len(active_messages) > 0:
-                sender_names = [
-                    active_messages[0]["sender__name"],
-                    active_messages[-1]["sender__name"],
-                ]
-            elif len(message_data) > 0:
-                sender_names = [
-                    message_data[0]["sender__name"],
-                    message_data[-1]["sender__name"],
-                ]
-
-            if sender_names:
-                # Get unique sender names from first and last messages
-                first_sender = sender_names[0]
-                last_sender = sender_names[-1]
-                if last_sender is not None and first_sender != last_sender:
-                    self.sender_names = [first_sender, last_sender]
-                else:
-                    self.sender_names = [first_sender]
+                self.sender_names = [first_sender]
 
         self.save(
             update_fields=[
@@ -759,6 +802,7 @@ class Thread(BaseModel):
                 "has_active",
                 "messaged_at",
                 "sender_names",
+                *(update_fields or []),
             ]
         )
 
@@ -1095,6 +1139,15 @@ class Message(BaseModel):
         verbose_name = _("message")
         verbose_name_plural = _("messages")
         ordering = ["-created_at"]
+        indexes = [
+            # Serves the thread's delivered messages (not drafts nor trashed) in
+            # their default order, e.g. when building AI summaries.
+            models.Index(
+                fields=["thread", "-created_at"],
+                condition=models.Q(is_draft=False, is_trashed=False),
+                name="message_thread_active_idx",
+            ),
+        ]
 
     def __str__(self):
         return str(self.subject) if self.subject else "(no subject)"
@@ -1128,31 +1181,33 @@ class Message(BaseModel):
             recipients_by_type[mr.type].append(mr.contact)
         return recipients_by_type
 
+    def get_text_body(self) -> str:
+        """Get the first text/plain body part of the message, or an empty string."""
+        for part in self.get_parsed_data().get("textBody", []):
+            if part.get("type") == "text/plain":
+                return part.get("content", "")
+        return ""
+
     def get_as_text(self) -> str:
         """Get the message as text, similar to the Message dataclass __str__ in utils.py."""
         # Date
         date_str = self.sent_at.isoformat() if self.sent_at else ""
         # Sender: "Name <email>" or just email
         sender = str(self.sender)
-        # Recipients: list of "Name <email>" or just email
-        to_contacts = self.recipients.filter(
-            type=MessageRecipientTypeChoices.TO
-        ).select_related("contact")
-        recipients = [str(mr.contact) for mr in to_contacts]
-        # CC
-        cc_contacts = self.recipients.filter(
-            type=MessageRecipientTypeChoices.CC
-        ).select_related("contact")
-        cc = [str(mr.contact) for mr in cc_contacts]
+        # Recipients and CC: list of "Name <email>" or just email, in one query
+        recipients = []
+        cc = []
+        for mr in self.recipients.filter(
+            type__in=[MessageRecipientTypeChoices.TO, MessageRecipientTypeChoices.CC]
+        ).select_related("contact"):
+            if mr.type == MessageRecipientTypeChoices.TO:
+                recipients.append(str(mr.contact))
+            else:
+                cc.append(str(mr.contact))
         # Subject
         subject = self.subject or _("No subject")
-        # Body: try to get text/plain from parsed data
-        body = ""
-        parsed_data = self.get_parsed_data()
-        for part in parsed_data.get("textBody", []):
-            if part.get("type") == "text/plain":
-                body = part.get("content", "")
-                break
+        # Body
+        body = self.get_text_body()
         # Message ID
         msg_id = str(self.id)
         return (
@@ -1169,13 +1224,8 @@ class Message(BaseModel):
         """Get the number of tokens in the message (subject + body)."""
         # Subject
         subject = self.subject or _("No subject")
-        # Body: try to get text/plain from parsed data
-        body = ""
-        parsed_data = self.get_parsed_data()
-        for part in parsed_data.get("textBody", []):
-            if part.get("type") == "text/plain":
-                body = part.get("content", "")
-                break
+        # Body
+        body = self.get_text_body()
         counted_text = f"{subject} {body}"
         return len(counted_text.split())
 
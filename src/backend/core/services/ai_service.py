@@ -6,6 +6,20 @@ from openai import OpenAI
 from core.ai.utils import is_ai_enabled
 
 
+def get_ai_client():
+    """Get the OpenAI client instance, reused so its HTTP connections are pooled."""
+    if not hasattr(get_ai_client, "cached_client"):
+        # The client retries connection errors, timeouts, 429 and 5xx responses
+        # with exponential backoff and jitter; other 4xx errors fail fast.
+        get_ai_client.cached_client = OpenAI(
+            base_url=settings.AI_BASE_URL,
+            api_key=settings.AI_API_KEY,
+            max_retries=settings.AI_MAX_RETRIES,
+            timeout=settings.AI_TIMEOUT,
+        )
+    return get_ai_client.cached_client
+
+
 class AIService:
     """Service class for AI-related operations."""
 
@@ -13,7 +27,7 @@ class AIService:
         """Ensure that the AI configuration is set properly."""
         if not is_ai_enabled():
             raise ImproperlyConfigured("AI configuration not set")
-        self.client = OpenAI(base_url=settings.AI_BASE_URL, api_key=settings.AI_API_KEY)
+        self.client = get_ai_client()
 
     def call_ai_api(self, prompt):
         """Helper method to call the OpenAI API and process the response."""
@@ -25,7 +39,7 @@ class AIService:
         }
 
         response = self.client.chat.completions.create(**data)
-        content = response.choices[0].message.content
+        content = response.choices[0].message.content if response.choices else None
 
         if not content:
             raise ValueError("AI response does not contain an answer")
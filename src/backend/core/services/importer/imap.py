@@ -13,6 +13,12 @@ from core.mda.rfc5322 import parse_email_message
 
 logger = get_task_logger(__name__)
 
+# Patterns to parse IMAP responses: FLAGS lists such as "FLAGS (\Seen \Flagged)"
+# and modified UTF-7 folder names
+IMAP_FLAGS_RE = re.compile(r"FLAGS\s*\(([^)]*)\)")
+IMAP_FLAG_RE = re.compile(r"\\\w+")
+IMAP_UTF7_RE = re.compile(r"&([^-]*)-")
+
 
 def decode_imap_utf7(s):
     """Decode IMAP UTF-7 encoded string to UTF-8.
@@ -32,7 +38,7 @@ def decode_imap_utf7(s):
         decoded_bytes = base64.b64decode(b64_text + "===")
         return decoded_bytes.decode("utf-16-be")
 
-    return re.sub(r"&([^-]*)-", decode_match, s)
+    return IMAP_UTF7_RE.sub(decode_match, s)
 
 
 class IMAPConnectionManager:
@@ -269,10 +275,10 @@ def _extract_flags_from_metadata(metadata: bytes) -> List[str]:
     flags = []
     metadata_str = metadata.decode(errors="ignore")
     if "FLAGS" in metadata_str:
-        flags_match = re.search(r"FLAGS\s*\(([^)]*)\)", metadata_str)
+        flags_match = IMAP_FLAGS_RE.search(metadata_str)
         if flags_match:
             flags_str = flags_match.group(1)
-            flags = re.findall(r"\\\w+", flags_str)
+            flags = IMAP_FLAG_RE.findall(flags_str)
     return flags
 
 
@@ -284,10 +290,10 @@ def _fetch_separate_flags(imap_connection, msg_num: bytes) -> List[str]:
             for flags_response in flags_data:
                 if isinstance(flags_response, bytes):
                     flags_str = flags_response.decode(errors="ignore")
-                    flags_match = re.search(r"FLAGS\s*\(([^)]*)\)", flags_str)
+                    flags_match = IMAP_FLAGS_RE.search(flags_str)
                     if flags_match:
                         flags_str_content = flags_match.group(1)
-                        return re.findall(r"\\\w+", flags_str_content)
+                        return IMAP_FLAG_RE.findall(flags_str_content)
     except Exception as e:
         logger.debug("Separate flags fetch failed: %s", e)
     return []
@@ -318,10 +324,10 @@ def _extract_imap_flags_and_content(msg_data) -> Tuple[List[str], Optional[bytes
             # Sometimes content can be directly in response_part
             response_str = response_part.decode(errors="ignore")
             if "FLAGS" in response_str:
-                flags_match = re.search(r"FLAGS\s*\(([^)]*)\)", response_str)
+                flags_match = IMAP_FLAGS_RE.search(response_str)
                 if flags_match:
                     flags_str = flags_match.group(1)
-                    flags = re.findall(r"\\\w+", flags_str)
+                    flags = IMAP_FLAG_RE.findall(flags_str)
             elif raw_email is None and len(response_part) > 100:
                 # If it's not flags, it might be content
                 raw_email = response_part
@@ -4,6 +4,7 @@
 import logging
 
 from django.conf import settings
+from django.db.models import Count
 
 from opensearchpy import OpenSearch
 from opensearchpy.exceptions import NotFoundError
@@ -14,6 +15,10 @@ from core.services.search.mapping import MESSAGE_INDEX, MESSAGE_MAPPING
 
 logger = logging.getLogger(__name__)
 
+# Number of threads fetched per round trip when walking large querysets, so that
+# a full reindex doesn't hold every thread in memory at once.
+REINDEX_CHUNK_SIZE = 100
+
 
 # OpenSearch client instantiation
 def get_opensearch_client():
@@ -50,9 +55,13 @@ def delete_index():
         return False
 
 
-def index_message(message: models.Message) -> bool:
-    """Index a single message."""
-    es = get_opensearch_client()
+def _build_message_document(message: models.Message, mailbox_ids=None):
+    """Build the OpenSearch document for a message, or None if it can't be parsed.
+
+    Recipients are read through message.recipients.all() so that a
+    prefetch_related("recipients__contact") done by the caller is used.
+    mailbox_ids can be passed when the caller already knows them for the thread.
+    """
 
     # Parse message content if it has a blob
     parsed_data = {}
@@ -62,7 +71,7 @@ def index_message(message: models.Message) -> bool:
         # pylint: disable=broad-exception-caught
         except Exception as e:
             logger.error("Error parsing blob content for message %s: %s", message.id, e)
-            return False
+            return None
 
     # Extract text content from parsed data
     text_body = ""
@@ -78,14 +87,21 @@ def index_message(message: models.Message) -> bool:
             [item.get("content", "") for item in parsed_data.get("htmlBody", [])]
         )
 
-    # Get recipient details
-    recipients = message.recipients.select_related("contact").all()
+    # Get recipient details, grouped by type in a single pass
+    recipient_names = {type_: [] for type_ in enums.MessageRecipientTypeChoices}
+    recipient_emails = {type_: [] for type_ in enums.MessageRecipientTypeChoices}
+    for recipient in message.recipients.all():
+        recipient_names[recipient.type].append(recipient.contact.name)
+        recipient_emails[recipient.type].append(recipient.contact.email)
 
     # Get mailbox information for this thread
-    mailbox_ids = list(message.thread.accesses.values_list("mailbox__id", flat=True))
+    if mailbox_ids is None:
+        mailbox_ids = list(
+            message.thread.accesses.values_list("mailbox__id", flat=True)
+        )
 
     # Build document
-    doc = {
+    return {
         "relation": {"name": "message", "parent": str(message.thread_id)},
         "message_id": str(message.id),
         "thread_id": str(message.thread_id),
@@ -96,36 +112,12 @@ def index_message(message: models.Message) -> bool:
         "subject": message.subject,
         "sender_name": message.sender.name,
         "sender_email": message.sender.email,
-        "to_name": [
-            r.contact.name
-            for r in recipients
-            if r.type == enums.MessageRecipientTypeChoices.TO
-        ],
-        "to_email": [
-            r.contact.email
-            for r in recipients
-            if r.type == enums.MessageRecipientTypeChoices.TO
-        ],
-        "cc_name": [
-            r.contact.name
-            for r in recipients
-            if r.type == enums.MessageRecipientTypeChoices.CC
-        ],
-        "cc_email": [
-            r.contact.email
-            for r in recipients
-            if r.type == enums.MessageRecipientTypeChoices.CC
-        ],
-        "bcc_name": [
-            r.contact.name
-            for r in recipients
-            if r.type == enums.MessageRecipientTypeChoices.BCC
-        ],
-        "bcc_email": [
-            r.contact.email
-            for r in recipients
-            if r.type == enums.MessageRecipientTypeChoices.BCC
-        ],
+        "to_name": recipient_names[enums.MessageRecipientTypeChoices.TO],
+        "to_email": recipient_emails[enums.MessageRecipientTypeChoices.TO],
+        "cc_name": recipient_names[enums.MessageRecipientTypeChoices.CC],
+        "cc_email": recipient_emails[enums.MessageRecipientTypeChoices.CC],
+        "bcc_name": recipient_names[enums.MessageRecipientTypeChoices.BCC],
+        "bcc_email": recipient_emails[enums.MessageRecipientTypeChoices.BCC],
         "text_body": text_body,
         "html_body": html_body,
         "is_draft": message.is_draft,
@@ -135,6 +127,15 @@ def index_message(message: models.Message) -> bool:
         "is_sender": message.is_sender,
     }
 
+
+def index_message(message: models.Message) -> bool:
+    """Index a single message."""
+    es = get_opensearch_client()
+
+    doc = _build_message_document(message)
+    if doc is None:
+        return False
+
     try:
         # pylint: disable=no-value-for-parameter
         es.index(
@@ -151,6 +152,23 @@ def index_message(message: models.Message) -> bool:
         return False
 
 
+def _bulk_index_thread_messages(es, thread: models.Thread, actions: list) -> bool:
+    """Send a bulk request indexing messages of a thread, logging any error."""
+    response = es.bulk(body=actions)
+    if response.get("errors"):
+        logger.error(
+            "Error bulk indexing messages of thread %s: %s",
+            thread.id,
+            [
+                item["index"]["error"]
+                for item in response.get("items", [])
+                if "error" in item.get("index", {})
+            ],
+        )
+        return False
+    return True
+
+
 def index_thread(thread: models.Thread) -> bool:
     """Index a thread and all its messages."""
     es = get_opensearch_client()
@@ -171,12 +189,35 @@ def index_thread(thread: models.Thread) -> bool:
         # pylint: disable=no-value-for-parameter
         es.index(index=MESSAGE_INDEX, id=str(thread.id), body=thread_doc)
 
-        # Index all messages in the thread
-        messages = thread.messages.all()
+        # Index the messages of the thread in bulk requests of bounded size,
+        # iterating them in chunks so their blobs are not all loaded at once
         success = True
-        for message in messages:
-            if not index_message(message):
+        actions = []
+        messages = thread.messages.select_related("sender", "blob").prefetch_related(
+            "recipients__contact"
+        )
+        for message in messages.iterator(chunk_size=REINDEX_CHUNK_SIZE):
+            doc = _build_message_document(message, mailbox_ids)
+            if doc is None:
                 success = False
+                continue
+            actions.append(
+                {
+                    "index": {
+                        "_index": MESSAGE_INDEX,
+                        "_id": str(message.id),
+                        "routing": str(thread.id),  # Ensure parent-child routing
+                    }
+                }
+            )
+            actions.append(doc)
+            # Each message takes an action line and a document line
+            if len(actions) >= 2 * REINDEX_CHUNK_SIZE:
+                success = _bulk_index_thread_messages(es, thread, actions) and success
+                actions = []
+
+        if actions:
+            success = _bulk_index_thread_messages(es, thread, actions) and success
 
         return success
     # pylint: disable=broad-exception-caught
@@ -197,10 +238,11 @@ def reindex_all():
     indexed_messages = 0
 
     # Index all threads
-    for thread in models.Thread.objects.all():
+    threads = models.Thread.objects.annotate(message_count=Count("messages"))
+    for thread in threads.iterator(chunk_size=REINDEX_CHUNK_SIZE):
         if index_thread(thread):
             indexed_threads += 1
-            indexed_messages += thread.messages.count()
+            indexed_messages += thread.message_count
 
     return {
         "status": "success",
@@ -221,10 +263,11 @@ def reindex_mailbox(mailbox_id: str):
         mailbox = models.Mailbox.objects.get(id=mailbox_id)
 
         # Index all threads the mailbox has access to
-        for thread in mailbox.threads_viewer:
+        threads = mailbox.threads_viewer.annotate(message_count=Count("messages"))
+        for thread in threads.iterator(chunk_size=REINDEX_CHUNK_SIZE):
             if index_thread(thread):
                 indexed_threads += 1
-                indexed_messages += thread.messages.count()
+                indexed_messages += thread.message_count
 
         return {
             "status": "success",
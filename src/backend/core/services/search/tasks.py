@@ -13,32 +13,29 @@ from core.services.search import (
     index_message,
     index_thread,
 )
+from core.services.search.index import REINDEX_CHUNK_SIZE
 
 from messages.celery_app import app as celery_app
 
 logger = get_task_logger(__name__)
 
 
-def _reindex_all_base(update_progress=None):
-    """Base function for reindexing all threads and messages.
+def _index_threads(threads, update_progress=None, progress_every=100):
+    """Index every thread of a queryset, isolating failures per thread.
 
     Args:
+        threads: Queryset of threads to index
         update_progress: Optional callback function to update progress
-    """
-    if not settings.OPENSEARCH_INDEX_THREADS:
-        logger.info("OpenSearch thread indexing is disabled.")
-        return {"success": False, "reason": "disabled"}
-
-    # Ensure index exists first
-    create_index_if_not_exists()
+        progress_every: Number of threads between two progress updates
 
-    # Get all threads and index them
-    threads = models.Thread.objects.all()
+    Returns:
+        dict: total, success_count and failure_count
+    """
     total = threads.count()
     success_count = 0
     failure_count = 0
 
-    for i, thread in enumerate(threads):
+    for i, thread in enumerate(threads.iterator(chunk_size=REINDEX_CHUNK_SIZE)):
         try:
             if index_thread(thread):
                 success_count += 1
@@ -50,17 +47,36 @@ def _reindex_all_base(update_progress=None):
             logger.exception("Error indexing thread %s: %s", thread.id, e)
 
         # Update progress if callback provided
-        if update_progress and i % 100 == 0:
+        if update_progress and i % progress_every == 0:
             update_progress(i, total, success_count, failure_count)
 
     return {
-        "success": True,
         "total": total,
         "success_count": success_count,
         "failure_count": failure_count,
     }
 
 
+def _reindex_all_base(update_progress=None):
+    """Base function for reindexing all threads and messages.
+
+    Args:
+        update_progress: Optional callback function to update progress
+    """
+    if not settings.OPENSEARCH_INDEX_THREADS:
+        logger.info("OpenSearch thread indexing is disabled.")
+        return {"success": False, "reason": "disabled"}
+
+    # Ensure index exists first
+    create_index_if_not_exists()
+
+    # Get all threads and index them
+    return {
+        "success": True,
+        **_index_threads(models.Thread.objects.all(), update_progress),
+    }
+
+
 @celery_app.task(bind=True)
 def reindex_all(self):
     """Celery task wrapper for reindexing all threads and messages."""
@@ -123,41 +139,24 @@ def reindex_mailbox_task(self, mailbox_id):
     # Ensure index exists first
     create_index_if_not_exists()
 
-    # Get all threads in the mailbox
-    threads = models.Mailbox.objects.get(id=mailbox_id).threads_viewer
-    total = threads.count()
-    success_count = 0
-    failure_count = 0
-
-    for i, thread in enumerate(threads):
-        try:
-            if index_thread(thread):
-                success_count += 1
-            else:
-                failure_count += 1
-        # pylint: disable=broad-exception-caught
-        except Exception as e:
-            failure_count += 1
-            logger.exception("Error indexing thread %s: %s", thread.id, e)
-
-        # Update progress every 50 threads
-        if i % 50 == 0:
-            self.update_state(
-                state="PROGRESS",
-                meta={
-                    "current": i,
-                    "total": total,
-                    "success_count": success_count,
-                    "failure_count": failure_count,
-                },
-            )
+    def update_progress(current, total, success_count, failure_count):
+        """Update task progress."""
+        self.update_state(
+            state="PROGRESS",
+            meta={
+                "current": current,
+                "total": total,
+                "success_count": success_count,
+                "failure_count": failure_count,
+            },
+        )
 
+    # Get all threads in the mailbox and index them, updating progress every 50
+    threads = models.Mailbox.objects.get(id=mailbox_id).threads_viewer
     return {
         "mailbox_id": str(mailbox_id),
         "success": True,
-        "total": total,
-        "success_count": success_count,
-        "failure_count": failure_count,
+        **_index_threads(threads, update_progress, progress_every=50),
     }
 
 
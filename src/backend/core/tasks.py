@@ -1,6 +1,7 @@
 # pylint: disable=wildcard-import, unused-wildcard-import
 """Register all tasks here so that Celery autodiscovery can find them."""
 
+from core.ai.tasks import *  # noqa: F403
 from core.mda.tasks import *  # noqa: F403
 from core.services.dns.tasks import *  # noqa: F403
 from core.services.importer.tasks import *  # noqa: F403
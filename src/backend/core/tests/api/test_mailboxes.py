@@ -1,5 +1,7 @@
 """Test the MailboxViewSet."""
 
+from django.db import connection
+from django.test.utils import CaptureQueriesContext
 from django.urls import reverse
 from django.utils import timezone
 
@@ -110,6 +112,22 @@ class TestMailboxViewSet:
         assert response.data[1]["count_unread_messages"] == 1
         assert response.data[1]["count_messages"] == 1
 
+    def test_list_num_queries(self, django_assert_num_queries):
+        """Test listing mailboxes does not query each mailbox's domain."""
+        authenticated_user = factories.UserFactory()
+        factories.MailboxAccessFactory(user=authenticated_user)
+        client = APIClient()
+        client.force_authenticate(user=authenticated_user)
+
+        with CaptureQueriesContext(connection) as single_mailbox_queries:
+            response = client.get(reverse("mailboxes-list"))
+        assert len(response.data) == 1
+
+        factories.MailboxAccessFactory.create_batch(3, user=authenticated_user)
+        with django_assert_num_queries(len(single_mailbox_queries)):
+            response = client.get(reverse("mailboxes-list"))
+        assert len(response.data) == 4
+
     def test_list_unauthorized(self):
         """Anonymous user cannot access the list of mailboxes."""
         client = APIClient()
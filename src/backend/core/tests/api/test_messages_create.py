@@ -514,6 +514,47 @@ class TestApiDraftAndSendMessage:
         assert draft_message.thread.subject == ""
         assert str(draft_message.thread) == "(no subject)"
 
+    def test_draft_message_recipients(self, mailbox, authenticated_user):
+        """Test create draft message with TO, CC, BCC and duplicate recipients."""
+        factories.MailboxAccessFactory(
+            mailbox=mailbox,
+            user=authenticated_user,
+            role=enums.MailboxRoleChoices.EDITOR,
+        )
+
+        client = APIClient()
+        client.force_authenticate(user=authenticated_user)
+
+        draft_response = client.post(
+            reverse("draft-message"),
+            {
+                "senderId": mailbox.id,
+                "subject": "Recipients",
+                "draftBody": "Test content",
+                "to": [
+                    "pierre@external.com",
+                    "paul@external.com",
+                    "pierre@external.com",
+                ],
+                "cc": ["jacques@external.com"],
+                "bcc": ["pierre@external.com"],
+            },
+            format="json",
+        )
+
+        assert draft_response.status_code == status.HTTP_201_CREATED
+        draft_message = models.Message.objects.get(id=draft_response.data["id"])
+        assert sorted(
+            draft_message.recipients.values_list("contact__email", "type")
+        ) == sorted(
+            [
+                ("pierre@external.com", enums.MessageRecipientTypeChoices.TO),
+                ("paul@external.com", enums.MessageRecipientTypeChoices.TO),
+                ("jacques@external.com", enums.MessageRecipientTypeChoices.CC),
+                ("pierre@external.com", enums.MessageRecipientTypeChoices.BCC),
+            ]
+        )
+
     def test_draft_message_without_subject(self, mailbox, authenticated_user):
         """Test create draft message without subject field."""
         factories.MailboxAccessFactory(
@@ -637,6 +678,70 @@ class TestApiDraftAndSendMessage:
         # Should fail due to max_length constraint
         assert draft_response.status_code == status.HTTP_400_BAD_REQUEST
 
+    @pytest.mark.parametrize(
+        "recipient",
+        ["not-an-email", f"{'a' * 250}@example.com"],
+    )
+    def test_draft_message_with_invalid_recipient(
+        self, mailbox, authenticated_user, recipient
+    ):
+        """Test create draft message with an invalid recipient email address."""
+        factories.MailboxAccessFactory(
+            mailbox=mailbox,
+            user=authenticated_user,
+            role=enums.MailboxRoleChoices.EDITOR,
+        )
+
+        client = APIClient()
+        client.force_authenticate(user=authenticated_user)
+
+        draft_response = client.post(
+            reverse("draft-message"),
+            {
+                "senderId": mailbox.id,
+                "subject": "Test subject",
+                "draftBody": "Test content",
+                "to": ["pierre@external.com", recipient],
+            },
+            format="json",
+        )
+
+        assert draft_response.status_code == status.HTTP_400_BAD_REQUEST
+        assert not models.Contact.objects.filter(email=recipient).exists()
+        assert not models.Message.objects.filter(subject="Test subject").exists()
+
+    def test_draft_reply_with_very_long_subject(self, mailbox, authenticated_user):
+        """Test create draft reply with subject exceeding max_length."""
+        factories.MailboxAccessFactory(
+            mailbox=mailbox,
+            user=authenticated_user,
+            role=enums.MailboxRoleChoices.EDITOR,
+        )
+        thread_access = factories.ThreadAccessFactory(
+            mailbox=mailbox,
+            role=enums.ThreadAccessRoleChoices.EDITOR,
+        )
+        message = factories.MessageFactory(thread=thread_access.thread)
+
+        client = APIClient()
+        client.force_authenticate(user=authenticated_user)
+
+        # No thread is created for a reply, the message itself must be validated
+        draft_response = client.post(
+            reverse("draft-message"),
+            {
+                "parentId": message.id,
+                "senderId": mailbox.id,
+                "subject": "A" * 256,
+                "draftBody": "Test content",
+                "to": ["pierre@external.com"],
+            },
+            format="json",
+        )
+
+        assert draft_response.status_code == status.HTTP_400_BAD_REQUEST
+        assert models.Message.objects.filter(thread=thread_access.thread).count() == 1
+
     def test_send_nonexistent_message(self, mailbox, authenticated_user, send_url):
         """Test sending a message that does not exist."""
         factories.MailboxAccessFactory(
@@ -192,6 +192,35 @@ class TestMessagesDelete:
         thread.refresh_from_db()
         assert thread.has_messages is True
 
+    def test_delete_draft_updates_thread_has_draft(self):
+        """Test deleting the last draft of a thread clears its has_draft flag."""
+        authenticated_user = factories.UserFactory()
+        mailbox = factories.MailboxFactory()
+        thread = factories.ThreadFactory()
+        factories.ThreadAccessFactory(
+            mailbox=mailbox,
+            thread=thread,
+            role=enums.ThreadAccessRoleChoices.EDITOR,
+        )
+        factories.MessageFactory(thread=thread)
+        draft = factories.MessageFactory(thread=thread, is_draft=True)
+        factories.MailboxAccessFactory(
+            mailbox=mailbox,
+            user=authenticated_user,
+            role=enums.MailboxRoleChoices.EDITOR,
+        )
+        thread.update_stats()
+        assert thread.has_draft is True
+
+        client = APIClient()
+        client.force_authenticate(user=authenticated_user)
+        response = client.delete(reverse("messages-detail", kwargs={"id": draft.id}))
+        assert response.status_code == status.HTTP_204_NO_CONTENT
+
+        thread.refresh_from_db()
+        assert thread.has_draft is False
+        assert thread.has_messages is True
+
     @pytest.mark.parametrize(
         "mailbox_role",
         [
@@ -3,7 +3,9 @@
 # pylint: disable=redefined-outer-name
 
 import json
+from unittest import mock
 
+from django.test import override_settings
 from django.urls import reverse
 from django.utils import timezone
 
@@ -345,6 +347,34 @@ def test_mark_messages_starred_success(api_client):
     assert thread.has_starred is True
 
 
+def test_mark_messages_starred_reindexes_unchanged_thread(api_client):
+    """Test starring a message reindexes its thread even if its stats don't change.
+
+    Flags are updated in bulk without saving the messages, so the thread save
+    is what refreshes the message flags in the search index."""
+    user = UserFactory()
+    api_client.force_authenticate(user=user)
+    mailbox = MailboxFactory(users_read=[user])
+    thread = ThreadFactory()
+    ThreadAccessFactory(
+        mailbox=mailbox, thread=thread, role=enums.ThreadAccessRoleChoices.EDITOR
+    )
+    msg1 = MessageFactory(thread=thread, is_starred=False)
+    MessageFactory(thread=thread, is_starred=True)  # Already starred
+    thread.update_stats()
+    assert thread.has_starred is True
+
+    data = {"flag": "starred", "value": True, "message_ids": [str(msg1.id)]}
+    with (
+        override_settings(OPENSEARCH_INDEX_THREADS=True),
+        mock.patch("core.signals.reindex_thread_task") as mock_reindex_thread_task,
+    ):
+        response = api_client.post(API_URL, data=data, format="json")
+
+    assert response.status_code == status.HTTP_200_OK
+    mock_reindex_thread_task.delay.assert_called_once_with(str(thread.id))
+
+
 def test_mark_messages_unstarred_success(api_client):
     """Test marking messages as unstarred successfully."""
     user = UserFactory()
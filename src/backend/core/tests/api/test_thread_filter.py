@@ -140,6 +140,28 @@ class TestThreadFilterLabel:
         assert response.status_code == status.HTTP_200_OK
         assert response.data["count"] == 0
 
+    def test_filter_threads_by_label_shared_across_mailboxes(
+        self, api_client, url, setup_threads_with_labels
+    ):
+        """Test a thread labelled in two mailboxes with the same slug is listed once."""
+        data = setup_threads_with_labels
+        label = factories.LabelFactory(mailbox=data["mailbox2"], name="Important")
+        assert label.slug == data["label1"].slug
+        factories.ThreadAccessFactory(
+            mailbox=data["mailbox2"],
+            thread=data["thread1"],
+            role=enums.ThreadAccessRoleChoices.EDITOR,
+        )
+        data["thread1"].labels.add(label)
+
+        response = api_client.get(url, {"label_slug": str(label.slug)})
+        assert response.status_code == status.HTTP_200_OK
+        assert response.data["count"] == 2
+        thread_ids = [t["id"] for t in response.data["results"]]
+        assert sorted(thread_ids) == sorted(
+            [str(data["thread1"].id), str(data["thread2"].id)]
+        )
+
     def test_filter_threads_by_invalid_label(
         self, api_client, url, setup_threads_with_labels
     ):
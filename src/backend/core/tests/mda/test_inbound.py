@@ -295,6 +295,59 @@ class TestDeliverInboundMessage:
         assert msg_recipient.contact.name == "Recipient Name"
         assert msg_recipient.contact.mailbox == target_mailbox
 
+    @override_settings(
+        AI_API_KEY="key",
+        AI_BASE_URL="https://ai.example.com",
+        AI_MODEL="model",
+        AI_FEATURE_SUMMARY_ENABLED=True,
+    )
+    @patch("core.mda.inbound.summarize_thread_task")
+    def test_delivery_schedules_thread_summary(
+        self,
+        mock_summarize_task,
+        target_mailbox,
+        sample_parsed_email,
+        raw_email_data,
+        django_capture_on_commit_callbacks,
+    ):
+        """Test delivery hands the thread summary over to a background task,
+        once the new message is committed."""
+        recipient_addr = f"{target_mailbox.local_part}@{target_mailbox.domain.name}"
+
+        with django_capture_on_commit_callbacks() as callbacks:
+            assert deliver_inbound_message(
+                recipient_addr, sample_parsed_email, raw_email_data
+            )
+        mock_summarize_task.delay.assert_not_called()
+
+        assert len(callbacks) == 1
+        callbacks[0]()
+        mock_summarize_task.delay.assert_called_once_with(
+            str(models.Thread.objects.get().id)
+        )
+
+    def test_html_only_delivery_snippet(
+        self, target_mailbox, sample_parsed_email, raw_email_data
+    ):
+        """Test the snippet of an HTML-only message skips tags, scripts and styles."""
+        del sample_parsed_email["textBody"]
+        sample_parsed_email["htmlBody"] = [
+            {
+                "content": (
+                    "<html><head><style>p { color: red; }</style></head>"
+                    "<body><script type='text/javascript'>alert(1)</script>"
+                    "<p>Hello&nbsp;<b>world</b> &amp; co</p></body></html>"
+                )
+            }
+        ]
+        recipient_addr = f"{target_mailbox.local_part}@{target_mailbox.domain.name}"
+
+        assert deliver_inbound_message(
+            recipient_addr, sample_parsed_email, raw_email_data
+        )
+
+        assert models.Thread.objects.get().snippet == "Hello world & co"
+
     @pytest.mark.parametrize(
         "role",
         [
@@ -4,7 +4,7 @@
 import pytest
 
 from core import models
-from core.factories import MailboxFactory, UserFactory
+from core.factories import ContactFactory, MailboxFactory, UserFactory
 
 pytestmark = pytest.mark.django_db
 
@@ -117,3 +117,47 @@ class TestMailboxModelAbilities:
         assert abilities["view_messages"] is True
         assert abilities["send_messages"] is True
         assert abilities["manage_labels"] is True
+
+
+class TestMailboxModelContacts:
+    """Test the get_or_create_contacts method on Mailbox models."""
+
+    def test_mailbox_get_or_create_contacts(self, mailbox, django_assert_num_queries):
+        """Test existing contacts are matched case-insensitively, others are created."""
+        existing = ContactFactory(
+            mailbox=mailbox, email="alice@example.com", name="Alice"
+        )
+        other_mailbox_contact = ContactFactory(email="bob@example.com")
+
+        with django_assert_num_queries(3):
+            contacts = mailbox.get_or_create_contacts(
+                {
+                    "Alice@Example.com": "Someone else",
+                    "bob@example.com": None,
+                    "carol@example.com": "Carol",
+                }
+            )
+
+        assert set(contacts) == {
+            "alice@example.com",
+            "bob@example.com",
+            "carol@example.com",
+        }
+        assert contacts["alice@example.com"] == existing
+        assert contacts["alice@example.com"].name == "Alice"
+        assert contacts["bob@example.com"] != other_mailbox_contact
+        assert contacts["bob@example.com"].name == "bob"
+        assert contacts["carol@example.com"].name == "Carol"
+        assert mailbox.contacts.count() == 3
+
+    def test_mailbox_get_or_create_contacts_all_existing(
+        self, mailbox, django_assert_num_queries
+    ):
+        """Test a single query is made when all contacts already exist."""
+        ContactFactory(mailbox=mailbox, email="alice@example.com")
+
+        with django_assert_num_queries(1):
+            contacts = mailbox.get_or_create_contacts({"alice@example.com": None})
+
+        assert list(contacts) == ["alice@example.com"]
+        assert mailbox.get_or_create_contacts({}) == {}
@@ -1 +1,45 @@
-# This file can be empty or contain other model tests if needed.
+"""Tests for the Message model."""
+# pylint: disable=redefined-outer-name
+
+import pytest
+
+from core import enums
+from core.factories import ContactFactory, MessageFactory, MessageRecipientFactory
+
+pytestmark = pytest.mark.django_db
+
+
+@pytest.fixture
+def message():
+    """Create a message with TO, CC and BCC recipients."""
+    message = MessageFactory(subject="Hello")
+    for name, email, recipient_type in [
+        ("Alice", "alice@example.com", enums.MessageRecipientTypeChoices.TO),
+        ("", "bob@example.com", enums.MessageRecipientTypeChoices.TO),
+        ("Carol", "carol@example.com", enums.MessageRecipientTypeChoices.CC),
+        ("Dave", "dave@example.com", enums.MessageRecipientTypeChoices.BCC),
+    ]:
+        MessageRecipientFactory(
+            message=message,
+            contact=ContactFactory(name=name, email=email),
+            type=recipient_type,
+        )
+    return message
+
+
+def test_message_get_as_text_recipients(message, django_assert_num_queries):
+    """Test get_as_text lists TO and CC recipients, without BCC, in a single query."""
+    with django_assert_num_queries(1):
+        text = message.get_as_text()
+
+    assert "alice@example.com" in text
+    lines = text.splitlines()
+    to_line = next(line for line in lines if line.startswith("To: "))
+    cc_line = next(line for line in lines if line.startswith("CC: "))
+    assert sorted(to_line[len("To: ") :].split(", ")) == [
+        "Alice <alice@example.com>",
+        "bob@example.com",
+    ]
+    assert cc_line == "CC: Carol <carol@example.com>"
+    assert "dave@example.com" not in text
+    assert "Subject: Hello" in lines
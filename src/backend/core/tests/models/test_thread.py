@@ -0,0 +1,32 @@
+"""Tests for the Thread model."""
+
+import pytest
+
+from core.factories import MessageFactory, ThreadFactory
+
+pytestmark = pytest.mark.django_db
+
+
+def test_thread_update_stats_saves_changes(django_assert_num_queries):
+    """Test update_stats saves the thread when its stats changed."""
+    thread = ThreadFactory()
+    MessageFactory(thread=thread, is_unread=True)
+
+    with django_assert_num_queries(2):
+        thread.update_stats()
+
+    thread.refresh_from_db()
+    assert thread.has_unread is True
+
+
+def test_thread_update_stats_saves_unchanged(django_assert_num_queries):
+    """Test update_stats saves the thread even when its stats did not change.
+
+    The save is what reindexes the thread's messages, whose flags may have
+    changed without changing the thread stats."""
+    thread = ThreadFactory()
+    MessageFactory(thread=thread, is_unread=True)
+    thread.update_stats()
+
+    with django_assert_num_queries(2):
+        thread.update_stats()
@@ -6,9 +6,11 @@ from django.test import override_settings
 
 import pytest
 
+from core import enums
 from core.factories import (
     MailboxFactory,
     MessageFactory,
+    MessageRecipientFactory,
     ThreadAccessFactory,
     ThreadFactory,
 )
@@ -58,6 +60,9 @@ def fixture_mock_es_client_index():
         # Setup search mock
         mock_es.search.return_value = {"hits": {"total": {"value": 0}, "hits": []}}
 
+        # Setup bulk mock
+        mock_es.bulk.return_value = {"errors": False, "items": []}
+
         mock_get_opensearch_client.return_value = mock_es
         mock_es.reset_mock()
         yield mock_es
@@ -114,6 +119,62 @@ def test_index_thread(mock_es_client_index, test_thread):
     # Verify ES client was called
     assert mock_es_client_index.index.call_count > 0
 
+    # Verify messages were sent in a single bulk request
+    mock_es_client_index.bulk.assert_called_once()
+    actions = mock_es_client_index.bulk.call_args.kwargs["body"]
+    message = test_thread.messages.get()
+    assert actions[0]["index"]["_id"] == str(message.id)
+    assert actions[0]["index"]["routing"] == str(test_thread.id)
+    assert actions[1]["message_id"] == str(message.id)
+
+
+@pytest.mark.django_db
+def test_index_thread_num_queries(
+    mock_es_client_index, test_thread, django_assert_num_queries
+):
+    """Test indexing a thread doesn't query the database once per message."""
+    MessageFactory.create_batch(2, thread=test_thread)
+    for message in test_thread.messages.all():
+        MessageRecipientFactory.create_batch(
+            2, message=message, type=enums.MessageRecipientTypeChoices.TO
+        )
+
+    # accesses, messages with sender and blob, recipients, contacts
+    with django_assert_num_queries(4):
+        assert index_thread(test_thread)
+
+    actions = mock_es_client_index.bulk.call_args.kwargs["body"]
+    assert len(actions) == 6
+    assert all(len(doc["to_email"]) == 2 for doc in actions[1::2])
+
+
+@pytest.mark.django_db
+def test_index_thread_batches(mock_es_client_index, test_thread):
+    """Test indexing a thread sends its messages in bulk requests of bounded size."""
+    MessageFactory.create_batch(2, thread=test_thread)
+
+    with mock.patch("core.services.search.index.REINDEX_CHUNK_SIZE", 2):
+        assert index_thread(test_thread)
+
+    assert mock_es_client_index.bulk.call_count == 2
+    batches = [call.kwargs["body"] for call in mock_es_client_index.bulk.call_args_list]
+    assert [len(actions) for actions in batches] == [4, 2]
+    indexed_ids = {
+        action["index"]["_id"] for actions in batches for action in actions[::2]
+    }
+    assert indexed_ids == {str(message.id) for message in test_thread.messages.all()}
+
+
+@pytest.mark.django_db
+def test_index_thread_bulk_errors(mock_es_client_index, test_thread):
+    """Test indexing a thread reports failure when the bulk request has errors."""
+    mock_es_client_index.bulk.return_value = {
+        "errors": True,
+        "items": [{"index": {"error": {"type": "mapper_parsing_exception"}}}],
+    }
+
+    assert not index_thread(test_thread)
+
 
 @pytest.mark.django_db
 def test_index_message(mock_es_client_index, test_thread):
@@ -159,6 +220,8 @@ def test_reindex_mailbox(mock_es_client_index, test_mailbox, test_thread):
     # Verify result
     assert result["status"] == "success"
     assert result["mailbox"] == str(test_mailbox.id)
+    assert result["indexed_threads"] == 1
+    assert result["indexed_messages"] == 1
 
 
 def test_search_threads_with_query(mock_es_client_search):
@@ -10,7 +10,8 @@ from django.core.exceptions import ValidationError
 import pytest
 
 from core import models
-from core.factories import MailboxFactory, UserFactory
+from core.ai.tasks import summarize_thread_task
+from core.factories import MailboxFactory, MessageFactory, ThreadFactory, UserFactory
 from core.mda.inbound import deliver_inbound_message
 from core.models import Message
 from core.services.importer.tasks import process_mbox_file_task, split_mbox_file
@@ -500,3 +501,57 @@ This is a malformed message.
 """
         messages = split_mbox_file(content)
         assert len(messages) == 0  # No valid messages should be found
+
+
+@pytest.mark.django_db
+class TestSummarizeThreadTask:
+    """Test the summarize_thread_task."""
+
+    @patch("core.ai.tasks.summarize_thread")
+    def test_summarize_thread_task_not_enough_content(self, mock_summarize):
+        """Test short threads are not sent to the AI."""
+        thread = ThreadFactory()
+        MessageFactory(thread=thread)
+
+        result = summarize_thread_task(str(thread.id))
+
+        assert result["summarized"] is False
+        mock_summarize.assert_not_called()
+
+    @patch("core.ai.tasks.summarize_thread")
+    def test_summarize_thread_task_success(self, mock_summarize):
+        """Test the summary is saved on threads with enough messages."""
+        mock_summarize.return_value = "A summary"
+        thread = ThreadFactory()
+        MessageFactory.create_batch(3, thread=thread)
+        MessageFactory(thread=thread, is_draft=True)
+
+        result = summarize_thread_task(str(thread.id))
+
+        assert result["summarized"] is True
+        thread.refresh_from_db()
+        assert thread.summary == "A summary"
+        # Drafts are not part of the summary
+        summarized_messages = mock_summarize.call_args.args[1]
+        assert len(summarized_messages) == 3
+
+    @patch("core.ai.tasks.summarize_thread")
+    def test_summarize_thread_task_ai_error(self, mock_summarize):
+        """Test AI errors are reported without touching the summary."""
+        mock_summarize.side_effect = ValueError(
+            "AI response does not contain an answer"
+        )
+        thread = ThreadFactory(summary="Previous summary")
+        MessageFactory.create_batch(3, thread=thread)
+
+        result = summarize_thread_task(str(thread.id))
+
+        assert result["success"] is False
+        thread.refresh_from_db()
+        assert thread.summary == "Previous summary"
+
+    def test_summarize_thread_task_thread_not_found(self):
+        """Test the task handles missing threads."""
+        result = summarize_thread_task(str(uuid.uuid4()))
+
+        assert result["success"] is False
@@ -553,6 +553,12 @@ class Base(Configuration):
     AI_API_KEY = values.Value(None, environ_name="AI_API_KEY", environ_prefix=None)
     AI_BASE_URL = values.Value(None, environ_name="AI_BASE_URL", environ_prefix=None)
     AI_MODEL = values.Value(None, environ_name="AI_MODEL", environ_prefix=None)
+    AI_MAX_RETRIES = values.PositiveIntegerValue(
+        3, environ_name="AI_MAX_RETRIES", environ_prefix=None
+    )
+    AI_TIMEOUT = values.PositiveIntegerValue(
+        60, environ_name="AI_TIMEOUT", environ_prefix=None
+    )
 
     AI_FEATURE_SUMMARY_ENABLED = values.BooleanValue(
         default=False, environ_name="AI_FEATURE_SUMMARY_ENABLED", environ_prefix=None